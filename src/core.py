@@ -1,17 +1,56 @@
 import pygame
 import math
+from functools import lru_cache
+from utils import Colors, get_font, get_circle, to_display_format, FONT_SMALL
 
-class Vector2:
-    """Simple 2D vector class"""
-    def __init__(self, x=0, y=0):
-        self.x = x
-        self.y = y
+# Colors used on the per-object draw path, bound once at import
+_ACCENT_COLOR = Colors.ACCENT_COLOR
+_SELECTION_COLOR = Colors.SELECTION_COLOR
+_TEXT_COLOR = Colors.TEXT_COLOR
+_CENTER_COLOR = (255, 255, 255)
+
+# Corners of a unit square centered at the origin, in drawing order
+_UNIT_CORNERS = ((-1, -1), (1, -1), (1, 1), (-1, 1))
+
+def rotate_square(cx, cy, half_size, cos_a, sin_a):
+    """Integer corner points of a square centered at (cx, cy), rotated by the given cos/sin"""
+    # Fold the half-size into the rotation terms once, then
+    # transform the unit corners in a single pass
+    rc = half_size * cos_a
+    rs = half_size * sin_a
+    return [(int(ux * rc - uy * rs + cx), int(ux * rs + uy * rc + cy))
+            for ux, uy in _UNIT_CORNERS]
+
+@lru_cache(maxsize=1024)
+def get_rotated_square(half_size, rotation):
+    """Transparent sprite of a square rotated by rotation degrees, with a direction indicator
     
-    def __str__(self):
-        return f"({self.x}, {self.y})"
+    The square is centered on the sprite, which is always an even number of pixels wide.
+    """
+    angle_rad = math.radians(rotation)
+    cos_a = math.cos(angle_rad)
+    sin_a = math.sin(angle_rad)
+    
+    # Corners reach half_size * sqrt(2) from the center, plus room for the line width
+    # (a negative half_size, from a negative scale, mirrors the square through its center)
+    center = math.ceil(abs(half_size) * math.sqrt(2)) + 2
+    sprite = pygame.Surface((center * 2, center * 2), pygame.SRCALPHA)
+    
+    # Draw rotated rectangle
+    pygame.draw.polygon(sprite, Colors.ACCENT_COLOR, rotate_square(center, center, half_size, cos_a, sin_a))
+    
+    # Draw direction indicator (line from center to front)
+    front = (int(center + half_size * cos_a), int(center + half_size * sin_a))
+    pygame.draw.line(sprite, (255, 255, 255), (center, center), front, 3)
+    return to_display_format(sprite)
+
+# 2D vector type (C implementation from pygame with x/y access and arithmetic)
+Vector2 = pygame.math.Vector2
 
 class Component:
     """Base class for all components"""
+    __slots__ = ('game_object',)
+    
     def __init__(self, game_object):
         self.game_object = game_object
     
@@ -23,6 +62,8 @@ class Component:
 
 class Transform(Component):
     """Transform component for position, rotation, scale"""
+    __slots__ = ('position', 'rotation', 'scale')
+    
     def __init__(self, game_object):
         super().__init__(game_object)
         self.position = Vector2(0, 0)
@@ -38,17 +79,33 @@ class GameObject:
         self.name = name
         self.transform = Transform(self)
         self.components = [self.transform]
+        self._components_by_type = {Transform: self.transform}  # First component per type
         self.selected = False
         self.visible = True
         self.children = []
         self.parent = None
+        
+        # Cached name label, re-rendered only when the name changes
+        self._name_surface = None
+        self._name_cached_for = None
     
     def add_component(self, component):
+        # get_component returns the first isinstance match, so an earlier component
+        # of a subclass keeps answering for this type
+        component_type = type(component)
+        if not any(isinstance(existing, component_type) for existing in self.components):
+            self._components_by_type.setdefault(component_type, component)
         self.components.append(component)
     
     def get_component(self, component_type):
+        component = self._components_by_type.get(component_type)
+        if component is not None:
+            return component
+        
+        # Fall back to a scan for subclass matches and remember the hit
         for component in self.components:
             if isinstance(component, component_type):
+                self._components_by_type[component_type] = component
                 return component
         return None
     
@@ -56,86 +113,193 @@ class GameObject:
         for component in self.components:
             component.update()
     
+    def get_draw_radius(self):
+        """Radius in pixels of the object's shape"""
+        base_radius = 32  # 32px diameter
+        scale_factor = max(self.transform.scale.x, self.transform.scale.y)
+        return int(base_radius * scale_factor / 2)  # Convert diameter to radius
+    
     def draw(self, surface):
         if not self.visible:
             return
         
-        # Import colors from utils to avoid circular imports
-        from utils import Colors
-        
-        # Calculate scaled radius
-        base_radius = 32  # 32px diameter
-        scale_factor = max(self.transform.scale.x, self.transform.scale.y)
-        scaled_radius = int(base_radius * scale_factor / 2)  # Convert diameter to radius
-        
-        # Draw selection outline
+        scaled_radius = self.get_draw_radius()
+        self.draw_outline(surface, scaled_radius)
+        self.draw_shape(surface, scaled_radius)
+        self.draw_center(surface)
+        self.draw_name(surface, scaled_radius)
+    
+    def draw_outline(self, surface, scaled_radius):
+        """Draw selection outline"""
         if self.selected:
-            outline_radius = scaled_radius + 5
-            pygame.draw.circle(surface, Colors.SELECTION_COLOR, 
-                             (int(self.transform.position.x), int(self.transform.position.y)), 
-                             outline_radius, 2)
+            surface.blit(*self.get_outline_blit(scaled_radius))
+    
+    def draw_shape(self, surface, scaled_radius):
+        """Draw the object body (a rotated square when rotated, else a circle)"""
+        surface.blit(*self.get_shape_blit(scaled_radius))
+    
+    def draw_center(self, surface):
+        """Draw center point"""
+        surface.blit(*self.get_center_blit())
+    
+    def draw_name(self, surface, scaled_radius):
+        """Draw name label below the object"""
+        surface.blit(*self.get_name_blit(scaled_radius))
+    
+    def get_outline_blit(self, scaled_radius):
+        """(sprite, position) of the selection outline"""
+        outline_radius = scaled_radius + 5
+        return (get_circle(outline_radius, _SELECTION_COLOR, 2),
+                (int(self.transform.position.x) - outline_radius - 1,
+                 int(self.transform.position.y) - outline_radius - 1))
+    
+    def get_shape_blit(self, scaled_radius):
+        """(sprite, position) of the object body"""
+        x = int(self.transform.position.x)
+        y = int(self.transform.position.y)
         
         # For rotation visualization, we'll draw a simple shape that shows rotation
         if self.transform.rotation != 0:
-            # Draw a rotated rectangle to show rotation
-            rect_width = scaled_radius * 2
-            rect_height = scaled_radius * 2
-            
-            # Create points for a rectangle centered at origin
-            points = [
-                (-rect_width//2, -rect_height//2),
-                (rect_width//2, -rect_height//2),
-                (rect_width//2, rect_height//2),
-                (-rect_width//2, rect_height//2)
-            ]
-            
-            # Rotate points
-            angle_rad = math.radians(self.transform.rotation)
-            cos_a = math.cos(angle_rad)
-            sin_a = math.sin(angle_rad)
-            
-            rotated_points = []
-            for px, py in points:
-                rx = px * cos_a - py * sin_a + self.transform.position.x
-                ry = px * sin_a + py * cos_a + self.transform.position.y
-                rotated_points.append((int(rx), int(ry)))
-            
-            # Draw rotated rectangle
-            pygame.draw.polygon(surface, Colors.ACCENT_COLOR, rotated_points)
-            
-            # Draw direction indicator (line from center to front)
-            front_x = int(self.transform.position.x + scaled_radius * cos_a)
-            front_y = int(self.transform.position.y + scaled_radius * sin_a)
-            pygame.draw.line(surface, (255, 255, 255), 
-                           (int(self.transform.position.x), int(self.transform.position.y)),
-                           (front_x, front_y), 3)
-        else:
-            # Draw simple circle when no rotation
-            pygame.draw.circle(surface, Colors.ACCENT_COLOR, 
-                             (int(self.transform.position.x), int(self.transform.position.y)), 
-                             scaled_radius)
-        
-        # Draw center point
-        pygame.draw.circle(surface, (255, 255, 255), 
-                         (int(self.transform.position.x), int(self.transform.position.y)), 2)
+            # Whole degrees keep the sprite cache small while dragging rotation
+            sprite = get_rotated_square(scaled_radius, round(self.transform.rotation) % 360)
+            half = sprite.get_width() // 2
+            return sprite, (x - half, y - half)
         
-        # Draw name
-        font = pygame.font.Font(None, 16)
-        text = font.render(self.name, True, Colors.TEXT_COLOR)
+        # Draw simple circle when no rotation
+        return get_circle(scaled_radius, _ACCENT_COLOR), (x - scaled_radius - 1, y - scaled_radius - 1)
+    
+    def get_center_blit(self):
+        """(sprite, position) of the center point"""
+        return (get_circle(2, _CENTER_COLOR),
+                (int(self.transform.position.x) - 3, int(self.transform.position.y) - 3))
+    
+    def get_name_blit(self, scaled_radius):
+        """(label, position) of the name below the object"""
+        if self._name_cached_for != self.name:
+            self._name_surface = to_display_format(get_font(FONT_SMALL).render(self.name, True, _TEXT_COLOR))
+            self._name_cached_for = self.name
+        text = self._name_surface
         text_x = self.transform.position.x - text.get_width() // 2
         text_y = self.transform.position.y + scaled_radius + 5
-        surface.blit(text, (int(text_x), int(text_y)))
+        return text, (int(text_x), int(text_y))
+
+class Quadtree:
+    """Region quadtree of axis-aligned boxes, answering which boxes contain a point"""
+    max_items = 8  # Items a leaf holds before it splits
+    max_depth = 8
+    
+    def __init__(self, left, top, right, bottom, depth=0):
+        self.bounds = (left, top, right, bottom)
+        self.depth = depth
+        self.items = []  # (item, box) pairs that don't fit inside a single child
+        self.children = None
+    
+    def insert(self, item, box):
+        node = self
+        while node.children is not None:
+            child = node.child_containing(box)
+            if child is None:
+                break
+            node = child
+        node.items.append((item, box))
+        if node.children is None and len(node.items) > node.max_items and node.depth < node.max_depth:
+            node.split()
+    
+    def split(self):
+        left, top, right, bottom = self.bounds
+        mid_x = (left + right) / 2
+        mid_y = (top + bottom) / 2
+        depth = self.depth + 1
+        self.children = (Quadtree(left, top, mid_x, mid_y, depth), Quadtree(mid_x, top, right, mid_y, depth),
+                         Quadtree(left, mid_y, mid_x, bottom, depth), Quadtree(mid_x, mid_y, right, bottom, depth))
+        
+        # Push items down into the new children where they fit
+        items = self.items
+        self.items = []
+        for item, box in items:
+            self.insert(item, box)
+    
+    def child_containing(self, box):
+        """Child whose quadrant fully contains box, or None if it straddles the midlines"""
+        left, top, right, bottom = self.bounds
+        mid_x = (left + right) / 2
+        mid_y = (top + bottom) / 2
+        box_left, box_top, box_right, box_bottom = box
+        if box_right < mid_x:
+            column = 0
+        elif box_left >= mid_x:
+            column = 1
+        else:
+            return None
+        if box_bottom < mid_y:
+            row = 0
+        elif box_top >= mid_y:
+            row = 1
+        else:
+            return None
+        return self.children[row * 2 + column]
+    
+    def query_point(self, x, y):
+        """Items whose box contains (x, y)"""
+        found = []
+        node = self
+        while True:
+            for item, (left, top, right, bottom) in node.items:
+                if left <= x <= right and top <= y <= bottom:
+                    found.append(item)
+            if node.children is None:
+                return found
+            
+            # Only the quadrant holding the point can contain more matches
+            left, top, right, bottom = node.bounds
+            node = node.children[(y >= (top + bottom) / 2) * 2 + (x >= (left + right) / 2)]
+    
+    def query_rect(self, left, top, right, bottom):
+        """Items whose box overlaps the rect from (left, top) to (right, bottom)"""
+        found = []
+        nodes = [self]
+        while nodes:
+            node = nodes.pop()
+            for item, (box_left, box_top, box_right, box_bottom) in node.items:
+                if box_left <= right and box_right >= left and box_top <= bottom and box_bottom >= top:
+                    found.append(item)
+            if node.children is not None:
+                # Skip quadrants entirely outside the rect
+                for child in node.children:
+                    child_left, child_top, child_right, child_bottom = child.bounds
+                    if child_left <= right and child_right >= left and child_top <= bottom and child_bottom >= top:
+                        nodes.append(child)
+        return found
 
 class Scene:
     """Scene management system"""
+    spatial_index_min_objects = 64  # Below this, picking just scans every object
+    
     def __init__(self):
         self.game_objects = []
         self.selected_object = None
+        self.dirty = True  # Set when scene content changes and needs a redraw
+        self.version = 0   # Incremented whenever the object list or selection changes
+        self._spatial_index = None  # Quadtree of object bounds, rebuilt on demand after changes
+    
+    def mark_dirty(self):
+        """Flag that objects were added, removed or moved"""
+        self.dirty = True
+        self._spatial_index = None
     
     def add_object(self, game_object):
         self.game_objects.append(game_object)
+        self.mark_dirty()
+        self.version += 1
         return game_object
     
+    def remove_object(self, game_object):
+        if game_object is self.selected_object:
+            self.select_object(None)
+        self.game_objects.remove(game_object)
+        self.mark_dirty()
+        self.version += 1
+    
     def select_object(self, game_object):
         # Deselect previous object
         if self.selected_object:
@@ -145,29 +309,104 @@ class Scene:
         self.selected_object = game_object
         if game_object:
             game_object.selected = True
+        self.dirty = True
+        self.version += 1
+    
+    def get_spatial_index(self):
+        """Quadtree of object indices by their bounding boxes, rebuilt only after changes"""
+        if self._spatial_index is None:
+            half_base = 16  # Same radii as the hit test in get_object_at_position
+            boxes = []
+            for obj in self.game_objects:
+                position, scale = obj.transform.position, obj.transform.scale
+                radius_x = half_base * max(0.01, abs(scale.x))
+                radius_y = half_base * max(0.01, abs(scale.y))
+                boxes.append((position.x - radius_x, position.y - radius_y,
+                              position.x + radius_x, position.y + radius_y))
+            
+            index = Quadtree(min((box[0] for box in boxes), default=0), min((box[1] for box in boxes), default=0),
+                             max((box[2] for box in boxes), default=0), max((box[3] for box in boxes), default=0))
+            for i, box in enumerate(boxes):
+                index.insert(i, box)
+            self._spatial_index = index
+        return self._spatial_index
+    
+    def get_objects_in_rect(self, left, top, right, bottom):
+        """Objects whose hit bounds may overlap the world rect, in scene order
+        
+        Uses the spatial index only while it is current; rebuilding it every frame
+        during a drag would cost more than the scan it saves.
+        """
+        if self._spatial_index is None or len(self.game_objects) < self.spatial_index_min_objects:
+            return self.game_objects
+        game_objects = self.game_objects
+        return [game_objects[i] for i in sorted(self._spatial_index.query_rect(left, top, right, bottom))]
     
     def get_object_at_position(self, x, y):
         """Get object at screen position (ellipse collision considering scale)"""
-        for obj in reversed(self.game_objects):  # Check from top to bottom
-            if obj.visible:
-                # Calculate scaled dimensions  
-                base_radius = 32  # 32px diameter
-                scale_x = max(0.01, abs(obj.transform.scale.x))
-                scale_y = max(0.01, abs(obj.transform.scale.y))
-                width = base_radius * scale_x / 2  # Convert diameter to radius for collision
-                height = base_radius * scale_y / 2  # Convert diameter to radius for collision
-                
-                # Check ellipse collision
-                dx = (x - obj.transform.position.x) / width
-                dy = (y - obj.transform.position.y) / height
-                if dx*dx + dy*dy <= 1.0:  # Inside ellipse
-                    return obj
+        half_base = 16  # 32px diameter -> 16px radius at scale 1
+        if len(self.game_objects) < self.spatial_index_min_objects:
+            candidates = reversed(self.game_objects)
+        else:
+            # Only objects whose bounding box contains the point
+            game_objects = self.game_objects
+            candidates = [game_objects[i] for i in sorted(self.get_spatial_index().query_point(x, y), reverse=True)]
+        
+        for obj in candidates:  # Check from top to bottom
+            if not obj.visible:
+                continue
+            position, scale = obj.transform.position, obj.transform.scale
+            
+            # Cheap bounding box rejection before the ellipse test,
+            # each radius only computed once the previous axis passed
+            dx = x - position.x
+            radius_x = half_base * max(0.01, abs(scale.x))
+            if dx > radius_x or dx < -radius_x:
+                continue
+            dy = y - position.y
+            radius_y = half_base * max(0.01, abs(scale.y))
+            if dy > radius_y or dy < -radius_y:
+                continue
+            
+            # Check ellipse collision (multiplied through to avoid divisions)
+            ex = dx * radius_y
+            ey = dy * radius_x
+            limit = radius_x * radius_y
+            if ex*ex + ey*ey <= limit*limit:  # Inside ellipse
+                return obj
         return None
     
     def update(self):
         for obj in self.game_objects:
             obj.update()
     
-    def draw(self, surface):
+    def draw(self, surface, view_rect=None):
+        """Draw visible objects, skipping those entirely outside view_rect"""
+        if view_rect is None:
+            view_rect = surface.get_clip()
+        
+        # Margin covers the selection outline and name label around each object
+        margin = 50
+        left = view_rect.left - margin
+        top = view_rect.top - margin
+        right = view_rect.right + margin
+        bottom = view_rect.bottom + margin
+        
+        visible = []
         for obj in self.game_objects:
-            obj.draw(surface)
+            if not obj.visible:
+                continue
+            radius = obj.get_draw_radius()
+            x = obj.transform.position.x
+            y = obj.transform.position.y
+            if x + radius < left or x - radius > right or y + radius < top or y - radius > bottom:
+                continue
+            visible.append((obj, radius))
+        
+        # Every part is a pre-rendered sprite, so the whole scene is one batched blit;
+        # parts are grouped in passes so outlines sit under shapes and names on top
+        blit_list = [obj.get_outline_blit(radius) for obj, radius in visible if obj.selected]
+        blit_list += [obj.get_shape_blit(radius) for obj, radius in visible]
+        blit_list += [obj.get_center_blit() for obj, radius in visible]
+        blit_list += [obj.get_name_blit(radius) for obj, radius in visible]
+        surface.blits(blit_list, doreturn=False)
@@ -1,9 +1,21 @@
 import pygame
 import sys
+import math
 from core import Vector2, Scene, GameObject
 from ui import Button, HierarchyPanel, InspectorPanel, ConsolePanel
 from systems import Console
-from utils import Colors, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, PROJECT_WIDTH, INSPECTOR_WIDTH, CONSOLE_HEIGHT, MENU_HEIGHT
+from utils import Colors, render_text, get_ellipse, to_display_format, MAX_SPRITE_SIZE, FONT_MEDIUM, FONT_LARGE, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, PROJECT_WIDTH, INSPECTOR_WIDTH, CONSOLE_HEIGHT, MENU_HEIGHT
+
+# Event types the editor reacts to; SDL drops everything else before it reaches the queue
+# (window exposes are kept so the display gets repainted)
+EDITOR_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                 pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.WINDOWEXPOSED]
+
+# Font sizes scene view object labels snap to as the zoom changes
+LABEL_FONT_SIZES = (12, 14, 16, 20, 24, 32, 48, 64)
+
+# Event types the scene view reacts to
+SCENE_VIEW_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL)
 
 class EditorCamera:
     """Camera system for the scene view with pan and zoom capabilities"""
@@ -17,36 +29,37 @@ class EditorCamera:
         
     def world_to_screen(self, world_pos):
         """Convert world coordinates to screen coordinates"""
-        # Calculate relative position from camera
-        relative_x = world_pos.x - self.position.x
-        relative_y = world_pos.y - self.position.y
-        
-        # Apply zoom and translate to screen center
-        screen_x = relative_x * self.zoom + self.viewport_center.x
-        screen_y = relative_y * self.zoom + self.viewport_center.y
-        
-        return Vector2(screen_x, screen_y)
+        return (world_pos - self.position) * self.zoom + self.viewport_center
     
     def screen_to_world(self, screen_pos):
         """Convert screen coordinates to world coordinates"""
-        # Calculate relative position from screen center
-        relative_x = (screen_pos.x - self.viewport_center.x) / self.zoom
-        relative_y = (screen_pos.y - self.viewport_center.y) / self.zoom
-        
-        # Add camera position to get world coordinates
-        world_x = relative_x + self.position.x
-        world_y = relative_y + self.position.y
-        
-        return Vector2(world_x, world_y)
+        return (screen_pos - self.viewport_center) / self.zoom + self.position
+    
+    def world_to_screen_xy(self, world_x, world_y):
+        """Convert world coordinates to a screen (x, y) tuple without allocating a Vector2"""
+        # Relative position from camera, zoomed and translated to screen center
+        zoom = self.zoom
+        return ((world_x - self.position.x) * zoom + self.viewport_center.x,
+                (world_y - self.position.y) * zoom + self.viewport_center.y)
+    
+    def screen_to_world_xy(self, screen_x, screen_y):
+        """Convert screen coordinates to a world (x, y) tuple without allocating a Vector2"""
+        # Relative position from screen center, unzoomed and offset by camera position
+        zoom = self.zoom
+        return ((screen_x - self.viewport_center.x) / zoom + self.position.x,
+                (screen_y - self.viewport_center.y) / zoom + self.position.y)
+    
+    def get_transform(self):
+        """Return (zoom, offset_x, offset_y) such that screen = world * zoom + offset"""
+        zoom = self.zoom
+        return (zoom,
+                self.viewport_center.x - self.position.x * zoom,
+                self.viewport_center.y - self.position.y * zoom)
     
     def pan(self, delta_x, delta_y):
         """Pan the camera by screen pixels"""
         # Convert screen delta to world delta
-        world_delta_x = delta_x / self.zoom
-        world_delta_y = delta_y / self.zoom
-        
-        self.position.x -= world_delta_x
-        self.position.y -= world_delta_y
+        self.position -= (delta_x / self.zoom, delta_y / self.zoom)
     
     def zoom_at_point(self, screen_point, zoom_factor):
         """Zoom in/out while keeping the screen point at the same position"""
@@ -62,8 +75,7 @@ class EditorCamera:
         
         # Adjust camera position to keep the point in the same place
         # (Reversed the direction to fix the inverted zoom behavior)
-        self.position.x -= world_point_after.x - world_point_before.x
-        self.position.y -= world_point_after.y - world_point_before.y
+        self.position -= world_point_after - world_point_before
     
     def reset_view(self):
         """Reset camera to origin with normal zoom"""
@@ -81,13 +93,34 @@ class SceneView:
         self.surface = pygame.Surface((width, height))
         self.scene = scene
         self.camera = EditorCamera(width, height)
+        self.view_transform = self.camera.get_transform()  # Camera snapshot for the current frame
 
         self.show_grid = True
         self.show_origin = True
         
+        # Pre-rendered 1px grid lines spanning the view, blitted at each line position
+        self.grid_line_vertical = pygame.Surface((1, height))
+        self.grid_line_vertical.fill((50, 50, 50))
+        self.grid_line_horizontal = pygame.Surface((width, 1))
+        self.grid_line_horizontal.fill((50, 50, 50))
+        
+        # Grid and origin only depend on the camera, so they are baked once per view
+        # and reused while objects change (e.g. during a drag)
+        self.background = pygame.Surface((width, height))
+        self._background_state = None
+        
+        # Last rendered grid (background color plus lines), keyed by line positions
+        self.grid_surface = pygame.Surface((width, height))
+        self._grid_key = None
+        
+        # Origin crosshair only moves with the camera, so it is drawn once and blitted
+        self.origin_cross_size = 20
+        self.origin_sprite = self.render_origin_sprite()
+        
         # Pan/zoom interaction state
         self.is_panning = False
-        self.last_mouse_pos = Vector2(0, 0)
+        self.last_mouse_pos = (0, 0)
+        self.mouse_pos = (0, 0)  # Screen position from the latest motion event
         self.hovered = False
         
         # Drag and drop state
@@ -95,14 +128,32 @@ class SceneView:
         self.dragged_object = None
         self.drag_start_pos = Vector2(0, 0)
         
+        # Overlay text areas from the last draw, and whether the mouse is over them
+        self.zoom_text_rect = pygame.Rect(10, 10, 0, 0)
+        self.camera_text_rect = pygame.Rect(10, 30, 0, 0)
+        self.zoom_text_hovered = False
+        self.camera_text_hovered = False
+        
+        # Everything the rendered surface depends on besides object data;
+        # self.surface is only re-rendered when this changes or the scene is dirty
+        self._drawn_state = None
+        
     def handle_event(self, event):
-        if not self.hovered:
+        if event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            self.update_overlay_hover(event.pos)
+        
+        if not self.hovered or event.type not in SCENE_VIEW_EVENTS:
             return False
-            
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        
+        # Wheel events carry no position, so use the last motion position
+        if event.type == pygame.MOUSEWHEEL:
+            mouse_x, mouse_y = self.mouse_pos
+        else:
+            mouse_x, mouse_y = event.pos
         local_mouse_x = mouse_x - self.rect.x
         local_mouse_y = mouse_y - self.rect.y
-        local_mouse_pos = Vector2(local_mouse_x, local_mouse_y)
+        local_mouse_pos = (local_mouse_x, local_mouse_y)
         
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
@@ -117,15 +168,15 @@ class SceneView:
                     return True
                 
                 # Object selection and drag start
-                world_pos = self.camera.screen_to_world(local_mouse_pos)
-                clicked_object = self.scene.get_object_at_position(world_pos.x, world_pos.y)
+                world_x, world_y = self.camera.screen_to_world_xy(local_mouse_x, local_mouse_y)
+                clicked_object = self.scene.get_object_at_position(world_x, world_y)
                 self.scene.select_object(clicked_object)
                 
                 # Start dragging if we clicked on an object
                 if clicked_object:
                     self.is_dragging_object = True
                     self.dragged_object = clicked_object
-                    self.drag_start_pos = world_pos
+                    self.drag_start_pos = Vector2(world_x, world_y)
                 
                 return True
             elif event.button == 2:  # Middle click - start panning
@@ -146,69 +197,80 @@ class SceneView:
         elif event.type == pygame.MOUSEMOTION:
             if self.is_panning:
                 # Pan the camera
-                delta_x = local_mouse_pos.x - self.last_mouse_pos.x
-                delta_y = local_mouse_pos.y - self.last_mouse_pos.y
+                delta_x = local_mouse_x - self.last_mouse_pos[0]
+                delta_y = local_mouse_y - self.last_mouse_pos[1]
                 self.camera.pan(delta_x, delta_y)
                 self.last_mouse_pos = local_mouse_pos
                 return True
             elif self.is_dragging_object and self.dragged_object:
-                # Drag the object
-                world_pos = self.camera.screen_to_world(local_mouse_pos)
-                self.dragged_object.transform.position = world_pos
+                # Drag the object (updating its position vector in place)
+                self.dragged_object.transform.position.update(
+                    self.camera.screen_to_world_xy(local_mouse_x, local_mouse_y))
+                self.scene.mark_dirty()
                 return True
             
         elif event.type == pygame.MOUSEWHEEL and self.hovered:
             # Zoom at mouse position
             zoom_factor = 1.1 if event.y > 0 else 0.9
-            self.camera.zoom_at_point(local_mouse_pos, zoom_factor)
+            self.camera.zoom_at_point(Vector2(local_mouse_pos), zoom_factor)
             return True
             
         return False
     
     def is_click_on_zoom_text(self, local_mouse_pos):
-        """Check if mouse click is on the zoom text overlay"""
-        font = pygame.font.Font(None, 20)
-        zoom_text = f"Zoom: {self.camera.zoom:.1f}x"
-        zoom_surface = font.render(zoom_text, True, Colors.TEXT_COLOR)
-        
-        # Create a rectangle for the zoom text area
-        zoom_rect = pygame.Rect(10, 10, zoom_surface.get_width(), zoom_surface.get_height())
-        return zoom_rect.collidepoint(local_mouse_pos.x, local_mouse_pos.y)
+        """Check if mouse click is on the zoom text overlay (as last drawn)"""
+        return self.zoom_text_rect.collidepoint(local_mouse_pos)
     
     def is_click_on_camera_text(self, local_mouse_pos):
-        """Check if mouse click is on the camera position text overlay"""
-        font = pygame.font.Font(None, 20)
-        pos_text = f"Camera: ({self.camera.position.x:.1f}, {self.camera.position.y:.1f})"
-        pos_surface = font.render(pos_text, True, Colors.TEXT_COLOR)
-        
-        # Create a rectangle for the camera text area
-        camera_rect = pygame.Rect(10, 30, pos_surface.get_width(), pos_surface.get_height())
-        return camera_rect.collidepoint(local_mouse_pos.x, local_mouse_pos.y)
+        """Check if mouse click is on the camera position text overlay (as last drawn)"""
+        return self.camera_text_rect.collidepoint(local_mouse_pos)
     
-    def update(self, mouse_pos):
-        self.hovered = self.rect.collidepoint(mouse_pos)
-        
+    def update_overlay_hover(self, mouse_pos):
+        """Recompute which overlay text the mouse is over (called on mouse motion)"""
+        local_mouse_pos = (mouse_pos[0] - self.rect.x, mouse_pos[1] - self.rect.y)
+        self.zoom_text_hovered = self.zoom_text_rect.collidepoint(local_mouse_pos)
+        self.camera_text_hovered = self.camera_text_rect.collidepoint(local_mouse_pos)
+    
+    def update(self, mouse_buttons):
         # Check if middle mouse button is still pressed globally
         # This fixes the issue where releasing MMB outside the scene view doesn't stop panning
-        if self.is_panning and not pygame.mouse.get_pressed()[1]:  # Index 1 is middle mouse button
+        if self.is_panning and not mouse_buttons[1]:  # Index 1 is middle mouse button
             self.is_panning = False
         
         # Check if left mouse button is still pressed globally (for dragging)
-        if self.is_dragging_object and not pygame.mouse.get_pressed()[0]:  # Index 0 is left mouse button
+        if self.is_dragging_object and not mouse_buttons[0]:  # Index 0 is left mouse button
             self.is_dragging_object = False
             self.dragged_object = None
     
     def draw(self, surface):
-        # Clear scene surface
-        self.surface.fill(Colors.DARK_GRAY)
-        
-        # Draw grid
-        if self.show_grid:
-            self.draw_grid()
+        # Snapshot the camera transform once for all draw helpers
+        self.view_transform = self.camera.get_transform()
+        
+        # Re-render only when something visible changed, else reuse last frame
+        state = (self.view_transform, self.scene.version, self.dragged_object,
+                 self.zoom_text_hovered, self.camera_text_hovered,
+                 self.show_grid, self.show_origin)
+        if self.scene.dirty or state != self._drawn_state:
+            self.render()
+            self._drawn_state = state
+        
+        # Blit to main surface, unless rendering already went straight into it
+        if self.surface.get_parent() is not surface:
+            surface.blit(self.surface, self.rect)
             
-        # Draw origin indicator
-        if self.show_origin:
-            self.draw_origin()
+    def set_target(self, surface):
+        """Render directly into the view's area of surface instead of a separate buffer"""
+        self.surface = surface.subsurface(self.rect)
+        self._drawn_state = None  # Force a render into the new buffer
+        
+    def render(self):
+        """Render grid, objects and overlays into the scene surface"""
+        # Background (grid and origin), rebuilt only when the view changes
+        background_state = (self.view_transform, self.show_grid, self.show_origin)
+        if background_state != self._background_state:
+            self.render_background()
+            self._background_state = background_state
+        self.surface.blit(self.background, (0, 0))
             
         # Draw scene objects with camera transformation
         self.draw_scene_objects()
@@ -219,10 +281,19 @@ class SceneView:
         # Draw border
         pygame.draw.rect(self.surface, Colors.BORDER_COLOR, (0, 0, self.rect.width, self.rect.height), 2)
         
-        # Blit to main surface
-        surface.blit(self.surface, self.rect)
+    def render_background(self):
+        """Render the grid and origin indicator into the background surface"""
+        self.background.fill(Colors.DARK_GRAY)
         
-    def draw_grid(self):
+        # Draw grid
+        if self.show_grid:
+            self.draw_grid(self.background)
+            
+        # Draw origin indicator
+        if self.show_origin:
+            self.draw_origin(self.background)
+        
+    def draw_grid(self, surface):
         """Draw grid lines with smart scaling like professional editors"""
         # Smart grid scaling: choose appropriate grid size based on zoom
         base_size = 32  # Base grid size in pixels (32px = common pixel art standard)
@@ -246,169 +317,162 @@ class SceneView:
         if screen_grid_size < 8 or screen_grid_size > 200:
             return
             
-        # Calculate world coordinates of the viewport corners
-        top_left_world = self.camera.screen_to_world(Vector2(0, 0))
-        bottom_right_world = self.camera.screen_to_world(Vector2(self.rect.width, self.rect.height))
-        
-        # Find grid lines that intersect the viewport
-        # Start from grid line before viewport and end after viewport
-        start_x = int(top_left_world.x / world_grid_size) * world_grid_size
-        end_x = int(bottom_right_world.x / world_grid_size + 1) * world_grid_size
-        start_y = int(top_left_world.y / world_grid_size) * world_grid_size  
-        end_y = int(bottom_right_world.y / world_grid_size + 1) * world_grid_size
-        
-        # Draw vertical lines
-        current_x = start_x
-        while current_x <= end_x:
-            screen_pos = self.camera.world_to_screen(Vector2(current_x, 0))
-            if 0 <= screen_pos.x <= self.rect.width:
-                pygame.draw.line(self.surface, (50, 50, 50), 
-                               (int(screen_pos.x), 0), 
-                               (int(screen_pos.x), self.rect.height))
-            current_x += world_grid_size
-            
-        # Draw horizontal lines  
-        current_y = start_y
-        while current_y <= end_y:
-            screen_pos = self.camera.world_to_screen(Vector2(0, current_y))
-            if 0 <= screen_pos.y <= self.rect.height:
-                pygame.draw.line(self.surface, (50, 50, 50),
-                               (0, int(screen_pos.y)), 
-                               (self.rect.width, int(screen_pos.y)))
-            current_y += world_grid_size
+        # Grid lines sit at multiples of the world grid size; each is placed with the camera
+        # transform and truncated to a whole pixel like the origin crosshair, and the last
+        # grid image is reused while those pixel columns and rows hold
+        camera = self.camera
+        width = self.rect.width
+        height = self.rect.height
+        left, top = camera.screen_to_world_xy(0, 0)
+        right, bottom = camera.screen_to_world_xy(width, height)
+        line_xs = tuple(int(x) for x, _ in (camera.world_to_screen_xy(i * world_grid_size, 0)
+                                            for i in range(math.floor(left / world_grid_size),
+                                                           math.ceil(right / world_grid_size) + 1))
+                        if 0 <= x <= width)
+        line_ys = tuple(int(y) for _, y in (camera.world_to_screen_xy(0, i * world_grid_size)
+                                            for i in range(math.floor(top / world_grid_size),
+                                                           math.ceil(bottom / world_grid_size) + 1))
+                        if 0 <= y <= height)
+        grid_key = (line_xs, line_ys)
+        if grid_key != self._grid_key:
+            self.render_grid(line_xs, line_ys)
+            self._grid_key = grid_key
+        surface.blit(self.grid_surface, (0, 0))
+        
+    def render_grid(self, line_xs, line_ys):
+        """Render grid lines at the given pixel columns and rows into the grid surface"""
+        # Draw vertical and horizontal lines in one batched blit
+        vertical = self.grid_line_vertical
+        horizontal = self.grid_line_horizontal
+        blit_list = [(vertical, (x, 0)) for x in line_xs]
+        blit_list += [(horizontal, (0, y)) for y in line_ys]
+        self.grid_surface.fill(Colors.DARK_GRAY)
+        self.grid_surface.blits(blit_list, doreturn=False)
     
-    def draw_origin(self):
+    def render_origin_sprite(self):
+        """Render the origin crosshairs into a small transparent surface"""
+        cross_size = self.origin_cross_size
+        origin_color = (100, 255, 100)  # Green
+        sprite = pygame.Surface((cross_size * 2 + 2, cross_size * 2 + 2), pygame.SRCALPHA)
+        
+        # Horizontal line
+        pygame.draw.line(sprite, origin_color,
+                       (0, cross_size), (cross_size * 2, cross_size), 2)
+        
+        # Vertical line
+        pygame.draw.line(sprite, origin_color,
+                       (cross_size, 0), (cross_size, cross_size * 2), 2)
+        
+        # Center dot
+        pygame.draw.circle(sprite, origin_color, (cross_size, cross_size), 3)
+        return to_display_format(sprite)
+    
+    def draw_origin(self, surface):
         """Draw origin (0,0) crosshairs"""
-        origin_screen = self.camera.world_to_screen(Vector2(0, 0))
+        # World (0, 0) lands exactly on the transform offset
+        _, origin_x, origin_y = self.view_transform
         
         # Only draw if origin is visible
-        if (0 <= origin_screen.x <= self.rect.width and 
-            0 <= origin_screen.y <= self.rect.height):
+        if (0 <= origin_x <= self.rect.width and 
+            0 <= origin_y <= self.rect.height):
+            cross_size = self.origin_cross_size
+            surface.blit(self.origin_sprite,
+                         (int(origin_x) - cross_size, int(origin_y) - cross_size))
+    
+    def get_visible_objects(self):
+        """Cull scene objects to those on screen, returning (object, screen_x, screen_y) tuples"""
+        # World-space bounds of the view (with some margin), so off-screen
+        # objects are rejected without being transformed
+        margin = 50
+        zoom, offset_x, offset_y = self.view_transform
+        min_x = (-margin - offset_x) / zoom
+        min_y = (-margin - offset_y) / zoom
+        max_x = (self.rect.width + margin - offset_x) / zoom
+        max_y = (self.rect.height + margin - offset_y) / zoom
+        
+        # Large scenes can narrow the candidates with the scene's spatial index
+        candidates = self.scene.get_objects_in_rect(min_x, min_y, max_x, max_y)
+        
+        # Single comprehension pass: cull, then transform the survivors
+        return [(obj, position.x * zoom + offset_x, position.y * zoom + offset_y)
+                for obj, position in ((obj, obj.transform.position)
+                                      for obj in candidates if obj.visible)
+                if min_x <= position.x <= max_x and min_y <= position.y <= max_y]
+    
+    def draw_scene_objects(self):
+        """Draw all scene objects using camera transformation"""
+        # Label size depends only on zoom; snapping to a short ladder keeps the font and text caches small
+        target_size = 16 * self.camera.zoom
+        font_size = min(LABEL_FONT_SIZES, key=lambda size: abs(size - target_size))
+        
+        for obj, screen_x, screen_y in self.get_visible_objects():
+            # Calculate scaled dimensions based on zoom AND object scale  
+            base_radius = 32  # 32px diameter (fits grid perfectly)
+            scale_x = max(0.01, abs(obj.transform.scale.x))  # Hard limit: minimum 0.01
+            scale_y = max(0.01, abs(obj.transform.scale.y))  # Hard limit: minimum 0.01
             
-            # Draw crosshairs
-            cross_size = 20
-            origin_color = (100, 255, 100)  # Green
+            # Calculate width and height separately for proper X/Y scaling
+            # (rounded up to even sizes so the cached ellipse surfaces get reused)
+            scaled_width = max(2, (int(base_radius * self.camera.zoom * scale_x) + 1) & ~1)
+            scaled_height = max(2, (int(base_radius * self.camera.zoom * scale_y) + 1) & ~1)
             
-            # Horizontal line
-            pygame.draw.line(self.surface, origin_color,
-                           (origin_screen.x - cross_size, origin_screen.y),
-                           (origin_screen.x + cross_size, origin_screen.y), 2)
+            # For circular objects, we'll draw an ellipse
+            scaled_radius = max(scaled_width, scaled_height)  # For selection outline
             
-            # Vertical line
-            pygame.draw.line(self.surface, origin_color,
-                           (origin_screen.x, origin_screen.y - cross_size),
-                           (origin_screen.x, origin_screen.y + cross_size), 2)
+            # Draw selection outline (ellipse for proper X/Y scaling)
+            if obj.selected:
+                selection_width = scaled_width + 10
+                selection_height = scaled_height + 10
+                self.draw_ellipse(screen_x, screen_y, selection_width, selection_height,
+                                  Colors.SELECTION_COLOR, 2)
             
-            # Center dot
-            pygame.draw.circle(self.surface, origin_color, 
-                             (int(origin_screen.x), int(origin_screen.y)), 3)
-    
-    def draw_scene_objects(self):
-        """Draw all scene objects using camera transformation"""
-        for obj in self.scene.game_objects:
-            if not obj.visible:
-                continue
-                
-            # Convert world position to screen position
-            screen_pos = self.camera.world_to_screen(obj.transform.position)
+            # Choose object color based on state
+            if self.is_dragging_object and obj == self.dragged_object:
+                object_color = (255, 200, 100)  # Orange when dragging
+            else:
+                object_color = Colors.ACCENT_COLOR  # Normal color
             
-            # Only draw if object is visible on screen (with some margin)
-            margin = 50
-            if (-margin <= screen_pos.x <= self.rect.width + margin and
-                -margin <= screen_pos.y <= self.rect.height + margin):
-                
-                # Calculate scaled dimensions based on zoom AND object scale  
-                base_radius = 32  # 32px diameter (fits grid perfectly)
-                scale_x = max(0.01, abs(obj.transform.scale.x))  # Hard limit: minimum 0.01
-                scale_y = max(0.01, abs(obj.transform.scale.y))  # Hard limit: minimum 0.01
-                
-                # Calculate width and height separately for proper X/Y scaling
-                scaled_width = max(1, int(base_radius * self.camera.zoom * scale_x))
-                scaled_height = max(1, int(base_radius * self.camera.zoom * scale_y))
-                
-                # For circular objects, we'll draw an ellipse
-                scaled_radius = max(scaled_width, scaled_height)  # For selection outline
-                
-                # Draw selection outline (ellipse for proper X/Y scaling)
-                if obj.selected:
-                    selection_width = scaled_width + 10
-                    selection_height = scaled_height + 10
-                    selection_rect = pygame.Rect(
-                        int(screen_pos.x - selection_width/2), 
-                        int(screen_pos.y - selection_height/2),
-                        selection_width, 
-                        selection_height
-                    )
-                    pygame.draw.ellipse(self.surface, Colors.SELECTION_COLOR, selection_rect, 2)
-                
-                # Choose object color based on state
-                if self.is_dragging_object and obj == self.dragged_object:
-                    object_color = (255, 200, 100)  # Orange when dragging
-                else:
-                    object_color = Colors.ACCENT_COLOR  # Normal color
-                
-                # Draw the object as ellipse (proper X/Y scaling)
-                object_rect = pygame.Rect(
-                    int(screen_pos.x - scaled_width/2), 
-                    int(screen_pos.y - scaled_height/2),
-                    scaled_width, 
-                    scaled_height
-                )
-                pygame.draw.ellipse(self.surface, object_color, object_rect)
-                
-                # Draw name (only if zoom is high enough)
-                if self.camera.zoom >= 0.5:
-                    font_size = max(12, int(16 * self.camera.zoom))
-                    font = pygame.font.Font(None, font_size)
-                    text = font.render(obj.name, True, Colors.TEXT_COLOR)
-                    text_pos = (screen_pos.x - text.get_width() // 2, 
-                               screen_pos.y + scaled_radius + 5)
-                    self.surface.blit(text, text_pos)
+            # Draw the object as ellipse (proper X/Y scaling)
+            self.draw_ellipse(screen_x, screen_y, scaled_width, scaled_height, object_color)
+            
+            # Draw name (only if zoom is high enough)
+            if self.camera.zoom >= 0.5:
+                text = render_text(font_size, obj.name, Colors.TEXT_COLOR)
+                text_pos = (screen_x - text.get_width() // 2, 
+                           screen_y + scaled_radius + 5)
+                self.surface.blit(text, text_pos)
+    
+    def draw_ellipse(self, center_x, center_y, width, height, color, line_width=0):
+        """Draw an ellipse centered on a screen point, from the sprite cache while it is small"""
+        x = int(center_x - width/2)
+        y = int(center_y - height/2)
+        if width <= MAX_SPRITE_SIZE and height <= MAX_SPRITE_SIZE:
+            self.surface.blit(get_ellipse(width, height, color, line_width), (x, y))
+        else:
+            # Caching ellipses this large (high zoom or scale) would cost far more memory than drawing them
+            pygame.draw.ellipse(self.surface, color, (x, y, width, height), line_width)
     
     def draw_ui_overlays(self):
         """Draw UI overlays like zoom level and coordinates"""
-        font = pygame.font.Font(None, 20)
-        
-        # Get current mouse position for hover detection
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        local_mouse_x = mouse_x - self.rect.x
-        local_mouse_y = mouse_y - self.rect.y
-        
         # Zoom level
         zoom_text = f"Zoom: {self.camera.zoom:.1f}x"
-        zoom_surface = font.render(zoom_text, True, Colors.TEXT_COLOR)
-        
-        # Check if hovering over zoom text
-        zoom_rect = pygame.Rect(10, 10, zoom_surface.get_width(), zoom_surface.get_height())
-        zoom_hovered = zoom_rect.collidepoint(local_mouse_x, local_mouse_y)
-        
-        # Draw zoom text with hover effect
-        zoom_color = Colors.ACCENT_COLOR if zoom_hovered else Colors.TEXT_COLOR
-        zoom_surface = font.render(zoom_text, True, zoom_color)
-        self.surface.blit(zoom_surface, (10, 10))
-        
-        # Add underline if hovered
-        if zoom_hovered:
-            pygame.draw.line(self.surface, zoom_color, (10, 10 + zoom_surface.get_height()), 
-                           (10 + zoom_surface.get_width(), 10 + zoom_surface.get_height()), 1)
+        self.zoom_text_rect = self.draw_overlay_text(zoom_text, (10, 10), self.zoom_text_hovered)
         
         # Camera position
         pos_text = f"Camera: ({self.camera.position.x:.1f}, {self.camera.position.y:.1f})"
-        pos_surface = font.render(pos_text, True, Colors.TEXT_COLOR)
-        
-        # Check if hovering over camera text
-        camera_rect = pygame.Rect(10, 30, pos_surface.get_width(), pos_surface.get_height())
-        camera_hovered = camera_rect.collidepoint(local_mouse_x, local_mouse_y)
-        
-        # Draw camera text with hover effect
-        camera_color = Colors.ACCENT_COLOR if camera_hovered else Colors.TEXT_COLOR
-        pos_surface = font.render(pos_text, True, camera_color)
-        self.surface.blit(pos_surface, (10, 30))
+        self.camera_text_rect = self.draw_overlay_text(pos_text, (10, 30), self.camera_text_hovered)
+    
+    def draw_overlay_text(self, text, pos, hovered):
+        """Draw clickable overlay text with hover effect, returning its rect"""
+        color = Colors.ACCENT_COLOR if hovered else Colors.TEXT_COLOR
+        text_surface = render_text(FONT_MEDIUM, text, color)  # Only re-rendered when text/color change
+        text_rect = self.surface.blit(text_surface, pos)
         
         # Add underline if hovered
-        if camera_hovered:
-            pygame.draw.line(self.surface, camera_color, (10, 30 + pos_surface.get_height()), 
-                           (10 + pos_surface.get_width(), 30 + pos_surface.get_height()), 1)
+        if hovered:
+            pygame.draw.line(self.surface, color, text_rect.bottomleft, 
+                           (text_rect.right, text_rect.bottom), 1)
+        return text_rect
 
 class PygameEditor:
     """Main editor class"""
@@ -416,6 +480,8 @@ class PygameEditor:
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Pygame Editor")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(EDITOR_EVENTS)
         self.clock = pygame.time.Clock()
         
         # Create console system
@@ -426,9 +492,16 @@ class PygameEditor:
         
         # Create panels
         self.create_panels()
+        self.scene_view.set_target(self.screen)
         
         # Editor state
         self.running = True
+        self.needs_redraw = True
+        self._hovered_widget = None  # Top-level widget under the mouse
+        self._dirty_rects = []  # Screen areas drawn since the last display update
+        self.mouse_pos = pygame.mouse.get_pos()  # Kept current from motion events afterwards
+        self.scene_view.mouse_pos = self.mouse_pos
+        self.update_hover(self.mouse_pos)
         self.object_counter = 1
         
         # Add some sample objects
@@ -465,6 +538,25 @@ class PygameEditor:
         # Add plus button to menu bar
         self.add_button = Button(150, 5, 30, 30, "+", self.add_object)
         
+        # Widgets that can be hovered, in hit-test order
+        self.hover_widgets = (self.add_button, self.hierarchy_panel, self.scene_view,
+                              self.inspector_panel, self.console_panel)
+        
+        # Which widgets need each event type; anything not listed is handled by the editor only.
+        # The inspector also acts on motion and button-up after the mouse has left it, so label
+        # drags continue outside its rect. The scene view only tracks the mouse position from
+        # motion outside its rect; pans and object drags pause there and end via the button
+        # polling in SceneView.update.
+        clickable = (self.add_button, self.hierarchy_panel, self.scene_view,
+                     self.inspector_panel, self.console_panel)
+        self.event_routes = {
+            pygame.MOUSEBUTTONDOWN: clickable,
+            pygame.MOUSEBUTTONUP: clickable,
+            pygame.MOUSEMOTION: (self.hierarchy_panel, self.scene_view, self.inspector_panel),
+            pygame.MOUSEWHEEL: (self.scene_view,),
+            pygame.KEYDOWN: (self.inspector_panel,),  # Text input fields
+        }
+        
     def create_sample_objects(self):
         """Create some sample objects for testing"""
         # Create a few sample objects positioned around the world origin
@@ -500,17 +592,29 @@ class PygameEditor:
         """Delete selected object"""
         if self.scene.selected_object:
             obj_name = self.scene.selected_object.name
-            self.scene.game_objects.remove(self.scene.selected_object)
-            self.scene.select_object(None)
+            self.scene.remove_object(self.scene.selected_object)
             self.console.log(f"Deleted {obj_name}")
         else:
             self.console.log("No object selected")
         
     def handle_events(self):
         """Handle pygame events"""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for i, event in enumerate(events):
+            # Handlers only use absolute positions, so in a run of motion events only the last matters
+            if (event.type == pygame.MOUSEMOTION and i + 1 < len(events)
+                    and events[i + 1].type == pygame.MOUSEMOTION):
+                continue
+            
+            # Any input can change hover/selection/camera state
+            self.needs_redraw = True
+            
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.MOUSEMOTION:
+                # Hover only changes when the mouse moves
+                self.mouse_pos = event.pos
+                self.update_hover(event.pos)
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
@@ -519,19 +623,31 @@ class PygameEditor:
                     self.delete_object()
                     
             # Handle UI events
-            mouse_pos = pygame.mouse.get_pos()
-            self.add_button.handle_event(event)  # Handle add button in menu bar
-            self.hierarchy_panel.handle_event(event)  # Handle hierarchy clicks
-            self.scene_view.handle_event(event)  # Handle scene view clicks
-            self.inspector_panel.handle_event(event)
-            self.console_panel.handle_event(event)
+            for widget in self.event_routes.get(event.type, ()):
+                widget.handle_event(event)
+            
+    def update_hover(self, mouse_pos):
+        """Move the hovered flag to the top-level widget under the mouse"""
+        widget = None
+        for candidate in self.hover_widgets:
+            if candidate.rect.collidepoint(mouse_pos):
+                widget = candidate
+                break
+        
+        if widget is not self._hovered_widget:
+            if self._hovered_widget:
+                self._hovered_widget.hovered = False
+            if widget:
+                widget.hovered = True
+            self._hovered_widget = widget
             
     def update(self):
         """Update editor state"""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.mouse_pos
+        mouse_buttons = pygame.mouse.get_pressed()  # Queried once per frame
         self.add_button.update(mouse_pos)  # Update add button
         self.hierarchy_panel.update(mouse_pos)
-        self.scene_view.update(mouse_pos)
+        self.scene_view.update(mouse_buttons)
         self.inspector_panel.update(mouse_pos)
         self.console_panel.update(mouse_pos)
         
@@ -540,36 +656,56 @@ class PygameEditor:
         
     def draw(self):
         """Draw the editor"""
-        # Clear screen
-        self.screen.fill(Colors.DARK_GRAY)
+        # Menu bar and panels cover the whole screen, so there is no clear; this keeps the
+        # scene view's pixels (rendered straight into the screen) when it has not changed
         
         # Draw menu bar
-        pygame.draw.rect(self.screen, Colors.PANEL_BG, (0, 0, SCREEN_WIDTH, MENU_HEIGHT))
-        pygame.draw.rect(self.screen, Colors.BORDER_COLOR, (0, 0, SCREEN_WIDTH, MENU_HEIGHT), 2)
+        menu_rect = pygame.Rect(0, 0, SCREEN_WIDTH, MENU_HEIGHT)
+        pygame.draw.rect(self.screen, Colors.PANEL_BG, menu_rect)
+        pygame.draw.rect(self.screen, Colors.BORDER_COLOR, menu_rect, 2)
+        self._dirty_rects.append(menu_rect)
         
         # Draw menu text
-        font = pygame.font.Font(None, 24)
-        text = font.render("Pygame Editor", True, Colors.TEXT_COLOR)
+        text = render_text(FONT_LARGE, "Pygame Editor", Colors.TEXT_COLOR)
         self.screen.blit(text, (10, 10))
         
         # Draw add button in menu bar
         self.add_button.draw(self.screen)
         
         # Draw panels
-        self.hierarchy_panel.draw(self.screen)
-        self.scene_view.draw(self.screen)
-        self.inspector_panel.draw(self.screen)
-        self.console_panel.draw(self.screen)
+        self.draw_panel(self.hierarchy_panel)
+        self.draw_panel(self.scene_view)
+        self.draw_panel(self.inspector_panel)
+        self.draw_panel(self.console_panel)
         
         # Update display
-        pygame.display.flip()
+        self.update_display()
+        
+    def draw_panel(self, panel):
+        """Draw one panel and mark its area for the next display update"""
+        panel.draw(self.screen)
+        self._dirty_rects.append(panel.rect)
+        
+    def update_display(self):
+        """Push only the drawn areas to the display"""
+        pygame.display.update(self._dirty_rects)
+        self._dirty_rects.clear()
         
     def run(self):
         """Main editor loop"""
         while self.running:
             self.handle_events()
             self.update()
-            self.draw()
+            
+            # Only redraw when something could have changed on screen
+            if self.needs_redraw or self.scene.dirty:
+                self.draw()
+                self.needs_redraw = False
+                self.scene.dirty = False
+            elif self.inspector_panel.is_animating():
+                # Only the inspector is changing (e.g. cursor blink)
+                self.draw_panel(self.inspector_panel)
+                self.update_display()
             self.clock.tick(FPS)
             
         pygame.quit()
@@ -1,22 +1,44 @@
 """System classes for the editor"""
+from collections import deque
+from itertools import islice
+from utils import Colors, render_text, FONT_NORMAL
 
 class Console:
     """Console system for displaying messages"""
-    def __init__(self):
-        self.messages = []
-        self.max_messages = 20
+    def __init__(self, max_messages=20):
+        self.messages = deque(maxlen=max_messages)  # Oldest messages drop off the front
+        self.rendered = deque(maxlen=max_messages)  # Text surface per message
+        self.debug = False  # Also echo messages to the terminal
+        self.version = 0  # Incremented whenever the messages change
+        
+    @property
+    def max_messages(self):
+        """Number of messages kept; fixed when the console is created"""
+        return self.messages.maxlen
         
     def log(self, message):
         """Add a message to the console"""
+        # Render once here so drawing the console is just blits; rendering first keeps
+        # messages and rendered in step if it fails (e.g. before pygame.init())
+        text_surface = render_text(FONT_NORMAL, message, Colors.TEXT_COLOR)
         self.messages.append(message)
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0)
-        print(message)  # Also print to terminal for debugging
+        self.rendered.append(text_surface)
+        if self.debug:
+            print(message)  # Also print to terminal for debugging
+        self.version += 1
         
     def clear(self):
         """Clear all messages"""
         self.messages.clear()
+        self.rendered.clear()
+        self.version += 1
+        
+    def get_messages(self, count=None):
+        """Get all messages, or only the last count of them"""
+        if count is None:
+            return list(self.messages)
+        return list(islice(self.messages, max(0, len(self.messages) - count), None))
         
-    def get_messages(self):
-        """Get all messages"""
-        return self.messages
+    def get_rendered_surfaces(self, count):
+        """Text surfaces of the last count messages"""
+        return islice(self.rendered, max(0, len(self.rendered) - count), None)
@@ -1,6 +1,19 @@
 import pygame
 import math
-from utils import Colors
+from utils import Colors, get_font, render_text, get_circle, property_accessors, to_display_format, FONT_SMALL, FONT_NORMAL, FONT_MEDIUM, FONT_LARGE
+
+# Event types that carry a mouse position in event.pos
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+# Last cursor passed to SDL, so redundant set_cursor calls can be skipped
+_current_cursor = None
+
+def set_cursor(cursor):
+    """Set the system mouse cursor, only calling into SDL when it changes"""
+    global _current_cursor
+    if cursor != _current_cursor:
+        pygame.mouse.set_cursor(cursor)
+        _current_cursor = cursor
 
 class UIElement:
     """Base class for all UI elements"""
@@ -13,7 +26,7 @@ class UIElement:
         return False
         
     def update(self, mouse_pos):
-        self.hovered = self.rect.collidepoint(mouse_pos)
+        pass
         
     def draw(self, surface):
         pass
@@ -25,6 +38,7 @@ class Button(UIElement):
         self.text = text
         self.action = action
         self.pressed = False
+        self._state_surfaces = {}  # (text, size, background color) -> pre-rendered button
         
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and self.hovered:
@@ -38,18 +52,28 @@ class Button(UIElement):
         return False
         
     def draw(self, surface):
+        surface.blit(self.get_state_surface(), self.rect)
+        
+    def get_state_surface(self):
+        """Button image for the current state, rendered on first use"""
         # Background
         color = Colors.HOVER_COLOR if self.hovered else Colors.PANEL_BG
         if self.pressed:
             color = Colors.ACCENT_COLOR
-        pygame.draw.rect(surface, color, self.rect)
-        pygame.draw.rect(surface, Colors.BORDER_COLOR, self.rect, 2)
-        
-        # Text
-        font = pygame.font.Font(None, 20)
-        text_surface = font.render(self.text, True, Colors.TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+            
+        key = (self.text, self.rect.size, color)
+        state_surface = self._state_surfaces.get(key)
+        if state_surface is None:
+            state_surface = pygame.Surface(self.rect.size)
+            local_rect = state_surface.get_rect()
+            pygame.draw.rect(state_surface, color, local_rect)
+            pygame.draw.rect(state_surface, Colors.BORDER_COLOR, local_rect, 2)
+            
+            # Text
+            text_surface = render_text(FONT_MEDIUM, self.text, Colors.TEXT_COLOR)
+            state_surface.blit(text_surface, text_surface.get_rect(center=local_rect.center))
+            self._state_surfaces[key] = state_surface
+        return state_surface
 
 class Panel(UIElement):
     """Panel container for UI elements"""
@@ -57,35 +81,53 @@ class Panel(UIElement):
         super().__init__(x, y, width, height)
         self.title = title
         self.elements = []
+        self._chrome = None  # Pre-rendered background, border and title
+        self._chrome_key = None
         
     def add_element(self, element):
         self.elements.append(element)
         
     def handle_event(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            # Hover only changes when the mouse moves; outside the panel none of its elements are hovered
+            for element in self.elements:
+                element.hovered = self.hovered and element.rect.collidepoint(event.pos)
+        
         for element in self.elements:
             if element.handle_event(event):
                 return True
         return False
         
     def update(self, mouse_pos):
-        super().update(mouse_pos)
         for element in self.elements:
             element.update(mouse_pos)
             
     def draw(self, surface):
-        # Panel background
-        pygame.draw.rect(surface, Colors.PANEL_BG, self.rect)
-        pygame.draw.rect(surface, Colors.BORDER_COLOR, self.rect, 2)
-        
-        # Title
-        if self.title:
-            font = pygame.font.Font(None, 24)
-            text_surface = font.render(self.title, True, Colors.TEXT_COLOR)
-            surface.blit(text_surface, (self.rect.x + 10, self.rect.y + 10))
+        # Panel background, border and title, rendered once per title and size
+        chrome_key = (self.title, self.rect.size)
+        if chrome_key != self._chrome_key:
+            self._chrome = self.render_chrome()
+            self._chrome_key = chrome_key
+        surface.blit(self._chrome, self.rect)
             
         # Draw elements
         for element in self.elements:
             element.draw(surface)
+            
+    def render_chrome(self):
+        """Render the panel background, border and title into a new surface"""
+        chrome = pygame.Surface(self.rect.size)
+        local_rect = chrome.get_rect()
+        
+        # Panel background
+        pygame.draw.rect(chrome, Colors.PANEL_BG, local_rect)
+        pygame.draw.rect(chrome, Colors.BORDER_COLOR, local_rect, 2)
+        
+        # Title
+        if self.title:
+            text_surface = render_text(FONT_LARGE, self.title, Colors.TEXT_COLOR)
+            chrome.blit(text_surface, (10, 10))
+        return chrome
 
 class TextInput:
     """Text input field with click-to-activate, pulsing, and Enter/Escape handling"""
@@ -101,9 +143,26 @@ class TextInput:
         self.selection_end = 0
         self.pulse_time = 0.0
         self.blink_time = 0.0
-        self.font = pygame.font.Font(None, 16)
+        self.font = get_font(FONT_SMALL)
         self.hovered = False
         
+        # Pixel offset of each caret position, rebuilt when value changes
+        self._width_prefix = [0]
+        self._width_prefix_for = ""
+        
+        # Last image of the field while inactive, keyed by (value, hovered)
+        self._idle_surface = None
+        self._idle_key = None
+        
+    def get_text_offset(self, index):
+        """Pixel x offset of the caret position index within the current value"""
+        if self._width_prefix_for != self.value:
+            # Measure each prefix as rendered, so kerning matches the drawn text
+            value = self.value
+            self._width_prefix = [0] + [self.font.size(value[:i])[0] for i in range(1, len(value) + 1)]
+            self._width_prefix_for = value
+        return self._width_prefix[index]
+        
     def activate(self):
         """Activate input field and select all text"""
         self.is_active = True
@@ -139,8 +198,10 @@ class TextInput:
         self.deactivate()
         
     def handle_event(self, event):
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        self.hovered = self.rect.collidepoint(mouse_x, mouse_y)
+        if event.type in MOUSE_EVENTS:
+            self.hovered = self.rect.collidepoint(event.pos)
+        elif event.type != pygame.KEYDOWN:
+            return False
         
         if not self.hovered and event.type == pygame.MOUSEBUTTONDOWN:
             if self.is_active:
@@ -257,6 +318,20 @@ class TextInput:
             self.blink_time += dt
             
     def draw(self, surface):
+        # Idle fields only change with their text and hover state, so their image is reused
+        if not self.is_active:
+            idle_key = (self.value, self.hovered)
+            if idle_key != self._idle_key:
+                self._idle_surface = pygame.Surface(self.rect.size)
+                self.draw_field(self._idle_surface, self._idle_surface.get_rect())
+                self._idle_key = idle_key
+            surface.blit(self._idle_surface, self.rect)
+            return
+        
+        self.draw_field(surface, self.rect)
+        
+    def draw_field(self, surface, rect):
+        """Draw the field background, text, selection and cursor into rect"""
         # Calculate colors based on state
         if self.is_active:
             # Pulsing effect when active
@@ -271,18 +346,20 @@ class TextInput:
             border_color = (80, 80, 80)
             
         # Draw background
-        pygame.draw.rect(surface, bg_color, self.rect)
-        pygame.draw.rect(surface, border_color, self.rect, 1)
+        pygame.draw.rect(surface, bg_color, rect)
+        pygame.draw.rect(surface, border_color, rect, 1)
         
         # Draw text
-        text_surface = self.font.render(self.value, True, Colors.TEXT_COLOR)
+        text_surface = render_text(FONT_SMALL, self.value, Colors.TEXT_COLOR)
         text_rect = text_surface.get_rect()
-        text_rect.centery = self.rect.centery
-        text_rect.x = self.rect.x + 5
+        text_rect.centery = rect.centery
+        text_rect.x = rect.x + 5
         
-        # Clip text to input area
-        clip_rect = pygame.Rect(self.rect.x + 3, self.rect.y + 1, self.rect.width - 6, self.rect.height - 2)
-        surface.set_clip(clip_rect)
+        # Clip text to input area (only needed when the text overflows it)
+        clip_rect = pygame.Rect(rect.x + 3, rect.y + 1, rect.width - 6, rect.height - 2)
+        needs_clip = not clip_rect.contains(text_rect)
+        if needs_clip:
+            surface.set_clip(clip_rect)
         
         # Draw selection background
         if self.is_active and self.selection_start != self.selection_end:
@@ -290,33 +367,25 @@ class TextInput:
             end_pos = max(self.selection_start, self.selection_end)
             
             # Calculate pixel positions
-            before_text = self.value[:start_pos]
-            selection_text = self.value[start_pos:end_pos]
-            
-            before_width = self.font.size(before_text)[0] if before_text else 0
-            selection_width = self.font.size(selection_text)[0] if selection_text else 0
+            before_width = self.get_text_offset(start_pos)
+            selection_width = self.get_text_offset(end_pos) - before_width
             
-            selection_rect = pygame.Rect(
-                text_rect.x + before_width,
-                text_rect.y,
-                selection_width,
-                text_rect.height
-            )
-            pygame.draw.rect(surface, (100, 100, 200), selection_rect)
+            # Solid fill is cheaper than going through the rect rasterizer
+            surface.fill((100, 100, 200), (text_rect.x + before_width, text_rect.y,
+                                           selection_width, text_rect.height))
             
         # Draw text
         surface.blit(text_surface, text_rect)
         
         # Draw cursor
         if self.is_active and (self.blink_time % 1.0) < 0.5:
-            cursor_text = self.value[:self.cursor_pos]
-            cursor_width = self.font.size(cursor_text)[0] if cursor_text else 0
-            cursor_x = text_rect.x + cursor_width
+            cursor_x = text_rect.x + self.get_text_offset(self.cursor_pos)
             pygame.draw.line(surface, Colors.TEXT_COLOR, 
                            (cursor_x, text_rect.y + 2), 
                            (cursor_x, text_rect.y + text_rect.height - 2), 1)
         
-        surface.set_clip(None)
+        if needs_clip:
+            surface.set_clip(None)
 
 class DragLabel:
     """Draggable label for quick value adjustments"""
@@ -331,23 +400,28 @@ class DragLabel:
         self.drag_start_x = 0
         self.drag_start_value = 0.0
         self.hovered = False
-        self.font = pygame.font.Font(None, 16)
+        
+        # Resolve the property path once instead of on every drag event
+        self._get_property, _ = property_accessors(property_path)
+        self._is_scale = "scale" in property_path.lower()
         
     def handle_event(self, event):
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        if event.type not in MOUSE_EVENTS:
+            return False
+        mouse_x, mouse_y = event.pos
         self.hovered = self.rect.collidepoint(mouse_x, mouse_y)
         
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.hovered:
             self.is_dragging = True
             self.drag_start_x = mouse_x
             self.drag_start_value = self.get_current_value()
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_SIZEWE)
+            set_cursor(pygame.SYSTEM_CURSOR_SIZEWE)
             return True
             
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if self.is_dragging:
                 self.is_dragging = False
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+                set_cursor(pygame.SYSTEM_CURSOR_ARROW)
                 return True
                 
         elif event.type == pygame.MOUSEMOTION and self.is_dragging:
@@ -355,7 +429,7 @@ class DragLabel:
             new_value = self.drag_start_value + (total_distance * self.step)
             
             # Hard limit for scale values
-            if "scale" in self.property_path.lower():
+            if self._is_scale:
                 new_value = max(0.01, new_value)
                 
             self.callback(self.property_path, new_value)
@@ -367,23 +441,12 @@ class DragLabel:
         """Get current value from the object"""
         if self.scene.selected_object:
             try:
-                obj = self.scene.selected_object
-                path_parts = self.property_path.split('.')
-                target = obj
-                for part in path_parts:
-                    target = getattr(target, part)
-                return float(target)
+                return float(self._get_property(self.scene.selected_object))
             except:
                 return 0.0
         return 0.0
         
     def draw(self, surface):
-        # Change cursor on hover
-        if self.hovered and not self.is_dragging:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_SIZEWE)
-        elif not self.hovered and not self.is_dragging:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
-            
         # Color based on state
         if self.is_dragging:
             color = (100, 150, 255)  # Blue when dragging
@@ -393,21 +456,34 @@ class DragLabel:
             color = Colors.TEXT_COLOR  # Normal color
             
         # Draw text
-        text_surface = self.font.render(self.text, True, color)
+        text_surface = render_text(FONT_SMALL, self.text, color)
         text_rect = text_surface.get_rect()
         text_rect.center = self.rect.center
         surface.blit(text_surface, text_rect)
 
+# Inspector transform rows: (property path, row, axis label, label x, field x, drag step).
+# X offsets are relative to the panel; rows are Position, Rotation, Scale.
+INSPECTOR_FIELDS = (
+    ("transform.position.x", 0, "X", 105, 130, 1.0),
+    ("transform.position.y", 0, "Y", 205, 230, 1.0),
+    ("transform.rotation",   1, "Z", 105, 130, 2.0),
+    ("transform.scale.x",    2, "X", 105, 130, 0.01),
+    ("transform.scale.y",    2, "Y", 205, 230, 0.01),
+)
+
 class InspectorPanel(Panel):
     """Inspector panel that shows properties of selected objects"""
     def __init__(self, x, y, width, height, scene):
         super().__init__(x, y, width, height, "Inspector")
         self.scene = scene
-        self.font = pygame.font.Font(None, 18)
-        self.small_font = pygame.font.Font(None, 16)
         self.input_fields = []
+        self.fields_by_path = {}  # property_path -> input fields editing it
         self.drag_labels = []
-        self.current_object = None  # Track which object we have fields for
+        self.current_object = None  # Track which object the fields are bound to
+        self._page = None  # Pre-rendered static labels for the selected object
+        self._page_name = None
+        self._shown_state = None  # (object, values, active flags) the field texts were last formatted from
+        self.create_fields()
         
     def on_value_change(self, property_path, value):
         """Callback when input field value changes"""
@@ -415,18 +491,15 @@ class InspectorPanel(Panel):
             obj = self.scene.selected_object
             try:
                 # Navigate to the property and set it
-                path_parts = property_path.split('.')
-                target = obj
-                for part in path_parts[:-1]:
-                    target = getattr(target, part)
-                setattr(target, path_parts[-1], value)
+                _, setter = property_accessors(property_path)
+                setter(obj, value)
+                self.scene.mark_dirty()
                 
                 # Update corresponding input field display values
-                for field in self.input_fields:
-                    if field.property_path == property_path:
-                        field.display_value = f"{value:.2f}"
-                        if not field.is_active:  # Only update if not currently being edited
-                            field.value = field.display_value
+                for field in self.fields_by_path.get(property_path, ()):
+                    field.display_value = f"{value:.2f}"
+                    if not field.is_active:  # Only update if not currently being edited
+                        field.value = field.display_value
                         
             except Exception as e:
                 print(f"Error setting property {property_path}: {e}")
@@ -435,6 +508,16 @@ class InspectorPanel(Panel):
         # Handle parent panel events first
         if super().handle_event(event):
             return True
+        
+        # Fields are only shown (and interactive) while an object is selected
+        if not self.scene.selected_object:
+            return False
+        
+        # Keys only matter to the field being edited; drag labels ignore them
+        if event.type == pygame.KEYDOWN:
+            return any(field.handle_event(event) for field in self.input_fields if field.is_active)
+        if event.type not in MOUSE_EVENTS:
+            return False
             
         # Handle input field events
         for field in self.input_fields:
@@ -452,137 +535,74 @@ class InspectorPanel(Panel):
         super().update(mouse_pos)
         # Update input fields based on selected object
         self.update_input_fields()
+        # Resolve the cursor once across all drag labels, so one label's hover isn't undone by the others
+        if self.scene.selected_object and any(label.hovered or label.is_dragging for label in self.drag_labels):
+            set_cursor(pygame.SYSTEM_CURSOR_SIZEWE)
+        else:
+            set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         # Update input field timings
         for field in self.input_fields:
             field.update(1/60)
         
-    def update_input_fields(self):
-        """Create/update input fields based on selected object"""
-        # Only recreate fields if selected object changed
-        if self.current_object != self.scene.selected_object:
-            self.input_fields.clear()
-            self.drag_labels.clear()
-            self.current_object = self.scene.selected_object
+    def is_animating(self):
+        """True while an input field is active and pulsing/blinking"""
+        return any(field.is_active for field in self.input_fields)
         
-        if self.scene.selected_object and not self.input_fields:
-            obj = self.scene.selected_object
-            start_y = self.rect.y + 130  # Match draw_object_inspector
-            row_height = 35
-            box_width = 60
-            box_height = 20
-            
-            # Position fields - right next to X and Y labels  
-            pos_y = start_y
-            pos_x_field = TextInput(
-                self.rect.x + 130, pos_y,  # Right after X label
-                box_width, box_height,
-                f"{obj.transform.position.x:.2f}",
-                self.on_value_change, "transform.position.x"
-            )
-            self.input_fields.append(pos_x_field)
-            
-            pos_y_field = TextInput(
-                self.rect.x + 230, pos_y,  # Right after Y label with more spacing
-                box_width, box_height,
-                f"{obj.transform.position.y:.2f}",
-                self.on_value_change, "transform.position.y"
-            )
-            self.input_fields.append(pos_y_field)
-            
-            # Rotation field - right next to Z label
-            rot_y = pos_y + row_height
-            rot_field = TextInput(
-                self.rect.x + 130, rot_y,  # Right after Z label
-                box_width, box_height,
-                f"{obj.transform.rotation:.2f}",
-                self.on_value_change, "transform.rotation"
-            )
-            self.input_fields.append(rot_field)
-            
-            # Scale fields - right next to X and Y scale labels
-            scale_y = rot_y + row_height
-            scale_x_field = TextInput(
-                self.rect.x + 130, scale_y,  # Right after X label
-                box_width, box_height,
-                f"{obj.transform.scale.x:.2f}",
-                self.on_value_change, "transform.scale.x"
-            )
-            self.input_fields.append(scale_x_field)
-            
-            scale_y_field = TextInput(
-                self.rect.x + 230, scale_y,  # Right after Y label with more spacing
+    def create_fields(self):
+        """Create the input fields and drag labels once; they are rebound on selection change"""
+        start_y = self.rect.y + 130  # Match draw_object_inspector
+        row_height = 35
+        box_width = 60
+        box_height = 20
+        
+        for property_path, row, label_text, label_dx, field_dx, step in INSPECTOR_FIELDS:
+            y = start_y + row * row_height
+            field = TextInput(
+                self.rect.x + field_dx, y,
                 box_width, box_height,
-                f"{obj.transform.scale.y:.2f}",
-                self.on_value_change, "transform.scale.y"
+                "0.00",
+                self.on_value_change, property_path
             )
-            self.input_fields.append(scale_y_field)
-            
-            # Create drag labels for X/Y/Z labels
-            # Position X/Y labels
-            pos_x_label = DragLabel(
-                self.rect.x + 105, pos_y,  # X label position
-                20, box_height, "X", 
-                self.on_value_change, "transform.position.x", self.scene, step=1.0
+            self.input_fields.append(field)
+            self.fields_by_path.setdefault(property_path, []).append(field)
+            
+            # Draggable axis label to the left of the field
+            label = DragLabel(
+                self.rect.x + label_dx, y,
+                20, box_height, label_text,
+                self.on_value_change, property_path, self.scene, step=step
             )
-            self.drag_labels.append(pos_x_label)
-            
-            pos_y_label = DragLabel(
-                self.rect.x + 205, pos_y,  # Y label position with more spacing
-                20, box_height, "Y",
-                self.on_value_change, "transform.position.y", self.scene, step=1.0
-            )
-            self.drag_labels.append(pos_y_label)
-            
-            # Rotation Z label
-            rot_z_label = DragLabel(
-                self.rect.x + 105, rot_y,  # Z label position
-                20, box_height, "Z",
-                self.on_value_change, "transform.rotation", self.scene, step=2.0
-            )
-            self.drag_labels.append(rot_z_label)
-            
-            # Scale X/Y labels
-            scale_x_label = DragLabel(
-                self.rect.x + 105, scale_y,  # X label position  
-                20, box_height, "X",
-                self.on_value_change, "transform.scale.x", self.scene, step=0.01
-            )
-            self.drag_labels.append(scale_x_label)
-            
-            scale_y_label = DragLabel(
-                self.rect.x + 205, scale_y,  # Y label position with more spacing
-                20, box_height, "Y", 
-                self.on_value_change, "transform.scale.y", self.scene, step=0.01
-            )
-            self.drag_labels.append(scale_y_label)
+            self.drag_labels.append(label)
         
-        # Update existing input field values to reflect current object properties
-        if self.scene.selected_object and self.input_fields:
-            obj = self.scene.selected_object
-            
-            # Update position fields
-            if len(self.input_fields) >= 2:
-                if not self.input_fields[0].is_active:  # Only update if not being edited
-                    self.input_fields[0].display_value = f"{obj.transform.position.x:.2f}"
-                    self.input_fields[0].value = self.input_fields[0].display_value
-                if not self.input_fields[1].is_active:  # Only update if not being edited
-                    self.input_fields[1].display_value = f"{obj.transform.position.y:.2f}"
-                    self.input_fields[1].value = self.input_fields[1].display_value
-            
-            # Update rotation field
-            if len(self.input_fields) >= 3:
-                if not self.input_fields[2].is_active:  # Only update if not being edited
-                    self.input_fields[2].display_value = f"{obj.transform.rotation:.2f}"
-                    self.input_fields[2].value = self.input_fields[2].display_value
-            
-            # Update scale fields
-            if len(self.input_fields) >= 5:
-                if not self.input_fields[3].is_active:  # Only update if not being edited
-                    self.input_fields[3].display_value = f"{obj.transform.scale.x:.2f}"
-                    self.input_fields[3].value = self.input_fields[3].display_value
-                if not self.input_fields[4].is_active:  # Only update if not being edited
-                    self.input_fields[4].display_value = f"{obj.transform.scale.y:.2f}"
-                    self.input_fields[4].value = self.input_fields[4].display_value
+        # Getter per field for refreshing its displayed value
+        self.field_getters = [(field, property_accessors(field.property_path)[0])
+                              for field in self.input_fields]
+        
+    def update_input_fields(self):
+        """Rebind input fields to the selected object and refresh their values"""
+        if self.current_object != self.scene.selected_object:
+            # Drop any in-progress edit or drag from the previous object
+            for field in self.input_fields:
+                field.deactivate()
+            for label in self.drag_labels:
+                label.is_dragging = False
+            self.current_object = self.scene.selected_object
+        
+        # Update input field values to reflect current object properties
+        obj = self.scene.selected_object
+        if obj:
+            # Only reformat the texts when a value or an edit state actually changed
+            state = (obj,
+                     tuple(getter(obj) for _, getter in self.field_getters),
+                     tuple(field.is_active for field in self.input_fields))
+            if state == self._shown_state:
+                return
+            self._shown_state = state
+            
+            for field, getter in self.field_getters:
+                if not field.is_active:  # Only update if not being edited
+                    field.display_value = f"{getter(obj):.2f}"
+                    field.value = field.display_value
 
     def draw(self, surface):
         # Draw panel background and title
@@ -603,42 +623,52 @@ class InspectorPanel(Panel):
             
     def draw_no_selection(self, surface):
         """Draw message when no object is selected"""
-        text = self.font.render("No object selected", True, (120, 120, 120))
+        text = render_text(FONT_NORMAL, "No object selected", (120, 120, 120))
         surface.blit(text, (self.rect.x + 15, self.rect.y + 50))
         
     def draw_object_inspector(self, surface, game_object):
         """Draw inspector for the selected game object in Unity style"""
-        start_y = self.rect.y + 60
+        # The static labels only depend on the object name, so they are composed once
+        if game_object.name != self._page_name:
+            self._page = self.render_inspector_page(game_object.name)
+            self._page_name = game_object.name
+        surface.blit(self._page, (self.rect.x, self.rect.y + 60))
+        
+    def render_inspector_page(self, name):
+        """Render the name, section header and row labels into one transparent surface"""
+        page = pygame.Surface((self.rect.width, 160), pygame.SRCALPHA)
+        start_y = 0
         row_height = 35
         
         # Object name
-        name_text = self.font.render(f"Name: {game_object.name}", True, Colors.TEXT_COLOR)
-        surface.blit(name_text, (self.rect.x + 15, start_y))
+        name_text = render_text(FONT_NORMAL, f"Name: {name}", Colors.TEXT_COLOR)
+        page.blit(name_text, (15, start_y))
         
         # Transform section header
-        transform_header = self.font.render("Transform", True, Colors.ACCENT_COLOR)
-        surface.blit(transform_header, (self.rect.x + 15, start_y + 30))
+        transform_header = render_text(FONT_NORMAL, "Transform", Colors.ACCENT_COLOR)
+        page.blit(transform_header, (15, start_y + 30))
         
         # Position row
         pos_y = start_y + 70
-        pos_text = self.small_font.render("Position", True, Colors.TEXT_COLOR)
-        surface.blit(pos_text, (self.rect.x + 20, pos_y))
+        pos_text = render_text(FONT_SMALL, "Position", Colors.TEXT_COLOR)
+        page.blit(pos_text, (20, pos_y))
         
         # X and Y labels are now draggable - removed static ones
         
         # Rotation row
         rot_y = pos_y + row_height
-        rot_text = self.small_font.render("Rotation", True, Colors.TEXT_COLOR)
-        surface.blit(rot_text, (self.rect.x + 20, rot_y))
+        rot_text = render_text(FONT_SMALL, "Rotation", Colors.TEXT_COLOR)
+        page.blit(rot_text, (20, rot_y))
         
         # Z label is now draggable - removed static one
         
         # Scale row
         scale_y = rot_y + row_height
-        scale_text = self.small_font.render("Scale", True, Colors.TEXT_COLOR)
-        surface.blit(scale_text, (self.rect.x + 20, scale_y))
+        scale_text = render_text(FONT_SMALL, "Scale", Colors.TEXT_COLOR)
+        page.blit(scale_text, (20, scale_y))
         
         # X and Y scale labels are now draggable - removed static ones
+        return to_display_format(page)
 
 class HierarchyItem:
     """Individual item in the hierarchy list"""
@@ -646,35 +676,47 @@ class HierarchyItem:
         self.game_object = game_object
         self.rect = pygame.Rect(x, y, width, height)
         self.hovered = False
-        self.selected = False
+        self._state_surfaces = {}  # Background color -> pre-rendered row for the cached name
+        self._cached_name = None
         
     def handle_event(self, event, mouse_pos):
         if event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(mouse_pos):
             return True
         return False
         
-    def update(self, mouse_pos):
-        self.hovered = self.rect.collidepoint(mouse_pos)
-        self.selected = self.game_object.selected
-        
     def draw(self, surface):
+        surface.blit(self.get_state_surface(), self.rect)
+        
+    def get_state_surface(self):
+        """Row image for the current state, rendered on first use"""
         # Background color based on state
-        if self.selected:
+        if self.game_object.selected:  # Kept current by Scene.select_object
             color = Colors.ACCENT_COLOR
         elif self.hovered:
             color = Colors.HOVER_COLOR
         else:
             color = Colors.PANEL_BG
             
-        pygame.draw.rect(surface, color, self.rect)
-        
-        # Object name
-        font = pygame.font.Font(None, 18)
-        text_surface = font.render(self.game_object.name, True, Colors.TEXT_COLOR)
-        surface.blit(text_surface, (self.rect.x + 20, self.rect.y + 5))
-        
-        # Draw icon (simple circle)
-        pygame.draw.circle(surface, Colors.ACCENT_COLOR, (self.rect.x + 10, self.rect.y + self.rect.height // 2), 4)
+        # Items are rebound to other objects, so drop rows rendered for an old name
+        name = self.game_object.name
+        if name != self._cached_name:
+            self._state_surfaces.clear()
+            self._cached_name = name
+            
+        state_surface = self._state_surfaces.get(color)
+        if state_surface is None:
+            state_surface = pygame.Surface(self.rect.size)
+            state_surface.fill(color)
+            
+            # Object name
+            text_surface = render_text(FONT_NORMAL, name, Colors.TEXT_COLOR)
+            state_surface.blit(text_surface, (20, 5))
+            
+            # Icon (simple circle)
+            icon = get_circle(4, Colors.ACCENT_COLOR)
+            state_surface.blit(icon, (10 - 5, self.rect.height // 2 - 5))
+            self._state_surfaces[color] = state_surface
+        return state_surface
 
 class HierarchyPanel(Panel):
     """Hierarchy panel that shows all scene objects in a list"""
@@ -684,47 +726,79 @@ class HierarchyPanel(Panel):
         self.items = []
         self.item_height = 25
         self.scroll_offset = 0
+        self._seen_version = -1  # Scene version the items were last built for
+        self.hovered_item = None
         
     def update_items(self):
-        """Update the hierarchy items list"""
-        self.items.clear()
+        """Update the hierarchy items list, reusing existing items"""
         start_y = self.rect.y + 35  # Below title
+        game_objects = self.scene.game_objects
+        
+        # Rebind the items we already have
+        for i, (item, game_object) in enumerate(zip(self.items, game_objects)):
+            item.game_object = game_object
+            item.rect.y = start_y + i * self.item_height
         
-        for i, game_object in enumerate(self.scene.game_objects):
+        # Grow or shrink to match the object count
+        for i in range(len(self.items), len(game_objects)):
             item_y = start_y + i * self.item_height
-            item = HierarchyItem(game_object, self.rect.x + 5, item_y, 
+            item = HierarchyItem(game_objects[i], self.rect.x + 5, item_y, 
                                self.rect.width - 10, self.item_height)
             self.items.append(item)
+        del self.items[len(game_objects):]
+        
+    def get_visible_items(self):
+        """Slice of items whose rows fall inside the panel"""
+        first = max(0, self.scroll_offset // self.item_height)
+        last = first + (self.rect.height - 35) // self.item_height + 1
+        return self.items[first:last]
+            
+    def update_item_hover(self, mouse_pos):
+        """Move the hover highlight to the item under the mouse, if any"""
+        hovered_item = None
+        if self.hovered:
+            # Rows are evenly spaced, so the candidate item follows from the y coordinate
+            index = (mouse_pos[1] - (self.rect.y + 35)) // self.item_height
+            if 0 <= index < len(self.items) and self.items[index].rect.collidepoint(mouse_pos):
+                hovered_item = self.items[index]
+        
+        if hovered_item is not self.hovered_item:
+            if self.hovered_item:
+                self.hovered_item.hovered = False
+            if hovered_item:
+                hovered_item.hovered = True
+            self.hovered_item = hovered_item
             
     def handle_event(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            self.update_item_hover(event.pos)
+        
         # Handle parent panel events first
         if super().handle_event(event):
             return True
             
         # Handle hierarchy item clicks
-        mouse_pos = pygame.mouse.get_pos()
-        for item in self.items:
-            if item.handle_event(event, mouse_pos):
+        if event.type not in MOUSE_EVENTS:
+            return False
+        for item in self.get_visible_items():
+            if item.handle_event(event, event.pos):
                 self.scene.select_object(item.game_object)
                 return True
         return False
         
     def update(self, mouse_pos):
         super().update(mouse_pos)
-        self.update_items()  # Update items every frame
-        
-        for item in self.items:
-            item.update(mouse_pos)
+        if self.scene.version != self._seen_version:
+            self.update_items()
+            self._seen_version = self.scene.version
             
     def draw(self, surface):
         # Draw panel background and title
         super().draw(surface)
         
-        # Draw hierarchy items
-        for item in self.items:
-            # Only draw items that are visible in the panel
-            if item.rect.y >= self.rect.y and item.rect.y <= self.rect.y + self.rect.height:
-                item.draw(surface)
+        # Draw hierarchy items (only those visible in the panel) in one batched blit
+        surface.blits([(item.get_state_surface(), item.rect) for item in self.get_visible_items()],
+                      doreturn=False)
 
 class ConsolePanel(Panel):
     """Console panel that displays console messages"""
@@ -732,17 +806,28 @@ class ConsolePanel(Panel):
         super().__init__(x, y, width, height, "Console")
         self.console = console
         self.scroll_offset = 0
+        self._page = None  # Chrome plus message lines, rebuilt when the console changes
+        self._page_key = None
         
     def draw(self, surface):
-        # Draw panel background and title
-        super().draw(surface)
-        
-        # Draw console messages
-        font = pygame.font.Font(None, 18)
+        # Compose the panel once per console change, then it is a single blit
+        page_key = (self.console.version, self.rect.size)
+        if page_key != self._page_key:
+            self._page = self.render_page()
+            self._page_key = page_key
+        surface.blit(self._page, self.rect)
+        
+    def render_page(self):
+        """Render the panel chrome and the latest console messages into a new surface"""
+        page = self.render_chrome()
+        
+        # Draw console messages (only the latest ones that fit below the title)
         line_height = 20
-        start_y = self.rect.y + 35  # Below title
-        
-        messages = self.console.get_messages()
-        for i, message in enumerate(messages[-10:]):  # Show last 10 messages
-            text_surface = font.render(message, True, Colors.TEXT_COLOR)
-            surface.blit(text_surface, (self.rect.x + 10, start_y + i * line_height))
+        start_y = 35  # Below title
+        visible_lines = max(0, (self.rect.height - start_y) // line_height)
+        
+        page.blits([(text_surface, (10, start_y + i * line_height))
+                    for i, text_surface
+                    in enumerate(self.console.get_rendered_surfaces(visible_lines))],
+                   doreturn=False)
+        return page
@@ -1,5 +1,9 @@
 """Utility functions, constants, and color definitions"""
 
+import pygame
+from functools import lru_cache
+from operator import attrgetter
+
 # --- Constants ---
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
@@ -11,6 +15,12 @@ INSPECTOR_WIDTH = 300
 CONSOLE_HEIGHT = 150
 MENU_HEIGHT = 40
 
+# Font sizes (one cached Font per size, see get_font)
+FONT_SMALL = 16
+FONT_NORMAL = 18
+FONT_MEDIUM = 20
+FONT_LARGE = 24
+
 class Colors:
     """Color definitions for the editor"""
     # Dark theme
@@ -28,10 +38,73 @@ class Colors:
     ERROR = (255, 100, 100)
     INFO = (100, 150, 255)
 
+@lru_cache(maxsize=None)
+def property_accessors(property_path):
+    """Get (getter, setter) functions for a dotted attribute path like "transform.position.x"
+    
+    Accessors are compiled once per path and shared by every caller.
+    """
+    parent_path, _, leaf = property_path.rpartition('.')
+    getter = attrgetter(property_path)
+    if parent_path:
+        get_parent = attrgetter(parent_path)
+        def setter(obj, value):
+            setattr(get_parent(obj), leaf, value)
+    else:
+        def setter(obj, value):
+            setattr(obj, leaf, value)
+    return getter, setter
+
 def clamp(value, min_val, max_val):
     """Clamp value between min and max"""
-    return max(min_val, min(max_val, value))
+    return min_val if value < min_val else max_val if value > max_val else value
 
 def lerp(a, b, t):
     """Linear interpolation"""
     return a + (b - a) * t
+
+def to_display_format(surface, alpha=True):
+    """Convert a surface to the display's pixel format so blits skip per-pixel conversion
+    
+    Surfaces created before the display mode is set are returned unchanged.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+# --- Font cache ---
+_FONT_CACHE = {}
+
+def get_font(size):
+    """Get the default font at the given size, creating it only once"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _FONT_CACHE[size] = font
+    return font
+
+@lru_cache(maxsize=4096)
+def render_text(size, text, color):
+    """Render antialiased text with the default font, reusing surfaces for repeated strings"""
+    return to_display_format(get_font(size).render(text, True, color))
+
+# --- Pre-rendered circles ---
+@lru_cache(maxsize=256)
+def get_circle(radius, color, width=0):
+    """Get a transparent surface with a circle drawn at its center (radius + 1, radius + 1)"""
+    # A negative radius (e.g. from a negative scale) draws nothing, as with pygame.draw.circle
+    radius = max(0, radius)
+    size = 2 * radius + 2
+    circle = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(circle, color, (radius + 1, radius + 1), radius, width)
+    return to_display_format(circle)
+
+# Largest width/height of a shape kept in the sprite caches; bigger shapes are drawn directly
+MAX_SPRITE_SIZE = 256
+
+@lru_cache(maxsize=256)
+def get_ellipse(width, height, color, line_width=0):
+    """Get a transparent width x height surface with an ellipse filling its bounds"""
+    ellipse = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.ellipse(ellipse, color, ellipse.get_rect(), line_width)
+    return to_display_format(ellipse)